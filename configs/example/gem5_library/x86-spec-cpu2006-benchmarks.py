@@ -51,7 +51,6 @@ scons build/X86/gem5.opt
 import argparse
 import time
 import os
-import json
 
 import m5
 from m5.objects import Root
@@ -69,24 +68,15 @@ from gem5.resources.resource import Resource, CustomDiskImageResource
 from gem5.simulate.simulator import Simulator
 from gem5.simulate.exit_event import ExitEvent
 
-from m5.stats.gem5stats import get_simstat
 from m5.util import warn
 from m5.util import fatal
 
-# We check for the required gem5 build.
-
-requires(
-    isa_required=ISA.X86,
-    coherence_protocol_required=CoherenceProtocol.MESI_TWO_LEVEL,
-    kvm_required=True,
-)
-
 # Following are the list of benchmark programs for SPEC CPU2006.
 # Note that 400.perlbench, 447.dealII, 450.soplex and 483.xalancbmk
 # have build errors, and, therefore cannot be executed. More information is
 # available at: https://www.gem5.org/documentation/benchmark_status/gem5-20
 
-benchmark_choices = [
+benchmark_choices = (
     "400.perlbench",
     "401.bzip2",
     "403.gcc",
@@ -117,203 +107,227 @@ benchmark_choices = [
     "483.xalancbmk",
     "998.specrand",
     "999.specrand",
-]
+)
 
 # Following are the input size.
 
-size_choices = ["test", "train", "ref"]
+size_choices = ("test", "train", "ref")
 
-parser = argparse.ArgumentParser(
-    description="An example configuration script to run the \
-        SPEC CPU2006 benchmarks."
-)
 
-# The arguments accepted are: a. disk-image name, b. benchmark name, c.
-# simulation size, and, d. root partition.
+def main():
+    # We check for the required gem5 build.
 
-# root partition is set to 1 by default.
+    requires(
+        isa_required=ISA.X86,
+        coherence_protocol_required=CoherenceProtocol.MESI_TWO_LEVEL,
+        kvm_required=True,
+    )
 
-parser.add_argument(
-    "--image",
-    type=str,
-    required=True,
-    help="Input the full path to the built spec-2006 disk-image.",
-)
+    parser = argparse.ArgumentParser(
+        description="An example configuration script to run the \
+            SPEC CPU2006 benchmarks."
+    )
 
-parser.add_argument(
-    "--partition",
-    type=str,
-    required=False,
-    default=None,
-    help='Input the root partition of the SPEC disk-image. If the disk is \
-    not partitioned, then pass "".',
-)
+    # The arguments accepted are: a. disk-image name, b. benchmark name, c.
+    # simulation size, and, d. root partition.
 
-parser.add_argument(
-    "--benchmark",
-    type=str,
-    required=True,
-    help="Input the benchmark program to execute.",
-    choices=benchmark_choices,
-)
+    # root partition is set to 1 by default.
 
-parser.add_argument(
-    "--size",
-    type=str,
-    required=True,
-    help="Sumulation size the benchmark program.",
-    choices=size_choices,
-)
+    parser.add_argument(
+        "--image",
+        type=str,
+        required=True,
+        help="Input the full path to the built spec-2006 disk-image.",
+    )
 
-args = parser.parse_args()
+    parser.add_argument(
+        "--partition",
+        type=str,
+        required=False,
+        default=None,
+        help='Input the root partition of the SPEC disk-image. If the disk is \
+        not partitioned, then pass "".',
+    )
 
-# We expect the user to input the full path of the disk-image.
-if args.image[0] != "/":
-    # We need to get the absolute path to this file. We assume that the file is
-    # present on the current working directory.
-    args.image = os.path.abspath(args.image)
+    parser.add_argument(
+        "--benchmark",
+        type=str,
+        required=True,
+        help="Input the benchmark program to execute.",
+        choices=benchmark_choices,
+    )
 
-if not os.path.exists(args.image):
-    warn("Disk image not found!")
-    print("Instructions on building the disk image can be found at: ")
-    print(
-        "https://gem5art.readthedocs.io/en/latest/tutorials/spec-tutorial.html"
+    parser.add_argument(
+        "--size",
+        type=str,
+        required=True,
+        help="Sumulation size the benchmark program.",
+        choices=size_choices,
     )
-    fatal(f"The disk-image is not found at {args.image}")
 
-# Setting up all the fixed system parameters here
-# Caches: MESI Two Level Cache Hierarchy
+    args = parser.parse_args()
 
-from gem5.components.cachehierarchies.ruby.mesi_two_level_cache_hierarchy import (
-    MESITwoLevelCacheHierarchy,
-)
+    # We expect the user to input the full path of the disk-image.
+    if args.image[0] != "/":
+        # We need to get the absolute path to this file. We assume that the
+        # file is present on the current working directory.
+        args.image = os.path.abspath(args.image)
 
-cache_hierarchy = MESITwoLevelCacheHierarchy(
-    l1d_size="32kB",
-    l1d_assoc=8,
-    l1i_size="32kB",
-    l1i_assoc=8,
-    l2_size="256kB",
-    l2_assoc=16,
-    num_l2_banks=2,
-)
-# Memory: Dual Channel DDR4 2400 DRAM device.
-# The X86 board only supports 3 GB of main memory.
-
-memory = DualChannelDDR4_2400(size="3GB")
-
-# Here we setup the processor. This is a special switchable processor in which
-# a starting core type and a switch core type must be specified. Once a
-# configuration is instantiated a user may call `processor.switch()` to switch
-# from the starting core types to the switch core types. In this simulation
-# we start with KVM cores to simulate the OS boot, then switch to the Timing
-# cores for the command we wish to run after boot.
-
-processor = SimpleSwitchableProcessor(
-    starting_core_type=CPUTypes.KVM,
-    switch_core_type=CPUTypes.TIMING,
-    isa=ISA.X86,
-    num_cores=2,
-)
+    if not os.path.exists(args.image):
+        warn("Disk image not found!")
+        print("Instructions on building the disk image can be found at: ")
+        print(
+            "https://gem5art.readthedocs.io/en/latest/tutorials/"
+            "spec-tutorial.html"
+        )
+        fatal(f"The disk-image is not found at {args.image}")
 
-# Here we setup the board. The X86Board allows for Full-System X86 simulations
+    # Setting up all the fixed system parameters here
+    # Caches: MESI Two Level Cache Hierarchy
 
-board = X86Board(
-    clk_freq="3GHz",
-    processor=processor,
-    memory=memory,
-    cache_hierarchy=cache_hierarchy,
-)
+    from gem5.components.cachehierarchies.ruby import (
+        mesi_two_level_cache_hierarchy as mesi_two_level,
+    )
 
-# SPEC CPU2006 benchmarks output placed in /home/gem5/spec2006/results
-# directory on the disk-image. The following folder is created in the
-# m5.options.outdir and the output from the disk-image folder is copied to
-# this folder.
-
-output_dir = "speclogs_" + "".join(x.strip() for x in time.asctime().split())
-output_dir = output_dir.replace(":", "")
-
-# We create this folder if it is absent.
-try:
-    os.makedirs(os.path.join(m5.options.outdir, output_dir))
-except FileExistsError:
-    warn("output directory already exists!")
-
-# Here we set the FS workload, i.e., SPEC CPU2006 benchmark
-# After simulation has ended you may inspect
-# `m5out/system.pc.com_1.device` to the stdout, if any.
-
-# After the system boots, we execute the benchmark program and wait till the
-# `m5_exit instruction encountered` is encountered. We start collecting
-# the number of committed instructions till ROI ends (marked by another
-# `m5_exit instruction encountered`). We then start copying the output logs,
-# present in the /home/gem5/spec2006/results directory to the `output_dir`.
-
-# The runscript.sh file places `m5 exit` before and after the following command
-# Therefore, we only pass this command without m5 exit.
-
-command = f"{args.benchmark} {args.size} {output_dir}"
-
-board.set_kernel_disk_workload(
-    # The x86 linux kernel will be automatically downloaded to the
-    # `~/.cache/gem5` directory if not already present.
-    # SPEC CPU2006 benchamarks were tested with kernel version 4.19.83 and
-    # 5.4.49
-    kernel=Resource("x86-linux-kernel-4.19.83"),
-    # The location of the x86 SPEC CPU 2017 image
-    disk_image=CustomDiskImageResource(
-        args.image, disk_root_partition=args.partition
-    ),
-    readfile_contents=command,
-)
+    cache_hierarchy = mesi_two_level.MESITwoLevelCacheHierarchy(
+        l1d_size="32kB",
+        l1d_assoc=8,
+        l1i_size="32kB",
+        l1i_assoc=8,
+        l2_size="256kB",
+        l2_assoc=16,
+        num_l2_banks=2,
+    )
+    # Memory: Dual Channel DDR4 2400 DRAM device.
+    # The X86 board only supports 3 GB of main memory.
+
+    memory = DualChannelDDR4_2400(size="3GB")
+
+    # Here we setup the processor. This is a special switchable processor in
+    # which a starting core type and a switch core type must be specified. Once
+    # a configuration is instantiated a user may call `processor.switch()` to
+    # switch from the starting core types to the switch core types. In this
+    # simulation we start with KVM cores to simulate the OS boot, then switch
+    # to the Timing cores for the command we wish to run after boot.
+
+    processor = SimpleSwitchableProcessor(
+        starting_core_type=CPUTypes.KVM,
+        switch_core_type=CPUTypes.TIMING,
+        isa=ISA.X86,
+        num_cores=2,
+    )
 
+    # Here we setup the board. The X86Board allows for Full-System X86
+    # simulations
 
-def handle_exit():
-    print("Done bootling Linux")
-    print("Resetting stats at the start of ROI!")
-    m5.stats.reset()
-    processor.switch()
-    yield False  # E.g., continue the simulation.
-    print("Dump stats at the end of the ROI!")
-    m5.stats.dump()
-    yield True  # Stop the simulation. We're done.
-
-
-simulator = Simulator(
-    board=board,
-    on_exit_event={
-        ExitEvent.EXIT: handle_exit(),
-    },
-)
+    board = X86Board(
+        clk_freq="3GHz",
+        processor=processor,
+        memory=memory,
+        cache_hierarchy=cache_hierarchy,
+    )
 
-# We maintain the wall clock time.
+    # SPEC CPU2006 benchmarks output placed in /home/gem5/spec2006/results
+    # directory on the disk-image. The following folder is created in the
+    # m5.options.outdir and the output from the disk-image folder is copied to
+    # this folder.
 
-globalStart = time.time()
+    output_dir = "speclogs_" + "".join(
+        x.strip() for x in time.asctime().split()
+    )
+    output_dir = output_dir.replace(":", "")
+
+    # We create this folder if it is absent.
+    try:
+        os.makedirs(os.path.join(m5.options.outdir, output_dir))
+    except FileExistsError:
+        warn("output directory already exists!")
+
+    # Here we set the FS workload, i.e., SPEC CPU2006 benchmark
+    # After simulation has ended you may inspect
+    # `m5out/system.pc.com_1.device` to the stdout, if any.
+
+    # After the system boots, we execute the benchmark program and wait till
+    # the `m5_exit instruction encountered` is encountered. We start collecting
+    # the number of committed instructions till ROI ends (marked by another
+    # `m5_exit instruction encountered`). We then start copying the output
+    # logs, present in the /home/gem5/spec2006/results directory to the
+    # `output_dir`.
+
+    # The runscript.sh file places `m5 exit` before and after the following
+    # command. Therefore, we only pass this command without m5 exit.
+
+    command = f"{args.benchmark} {args.size} {output_dir}"
+
+    board.set_kernel_disk_workload(
+        # The x86 linux kernel will be automatically downloaded to the
+        # `~/.cache/gem5` directory if not already present.
+        # SPEC CPU2006 benchamarks were tested with kernel version 4.19.83 and
+        # 5.4.49
+        kernel=Resource("x86-linux-kernel-4.19.83"),
+        # The location of the x86 SPEC CPU 2017 image
+        disk_image=CustomDiskImageResource(
+            args.image, disk_root_partition=args.partition
+        ),
+        readfile_contents=command,
+    )
 
-print("Running the simulation")
-print("Using KVM cpu")
+    def handle_exit():
+        print("Done bootling Linux")
+        print("Resetting stats at the start of ROI!")
+        m5.stats.reset()
+        processor.switch()
+        yield False  # E.g., continue the simulation.
+        print("Dump stats at the end of the ROI!")
+        m5.stats.dump()
+        yield True  # Stop the simulation. We're done.
+
+    simulator = Simulator(
+        board=board,
+        on_exit_event={
+            ExitEvent.EXIT: handle_exit(),
+        },
+    )
 
-m5.stats.reset()
+    # We maintain the wall clock time.
 
-# We start the simulation
-simulator.run()
+    globalStart = time.time()
 
-# Simulation is over at this point. We acknowledge that all the simulation
-# events were successful.
-print("All simulation events were successful.")
-# We print the final simulation statistics.
+    print("Running the simulation")
+    print("Using KVM cpu")
 
-print("Performance statistics:")
+    m5.stats.reset()
 
-roi_begin_ticks = simulator.get_tick_stopwatch()[0][1]
-roi_end_ticks = simulator.get_tick_stopwatch()[1][1]
+    # We start the simulation
+    simulator.run()
 
-print("roi simulated ticks: " + str(roi_end_ticks - roi_begin_ticks))
+    # We take the wall clock time once, so the seconds and minutes reported
+    # below agree with one another.
+    wallclock_time = time.time() - globalStart
 
-print(
-    "Ran a total of", simulator.get_current_tick() / 1e12, "simulated seconds"
-)
-print(
-    "Total wallclock time: %.2fs, %.2f min"
-    % (time.time() - globalStart, (time.time() - globalStart) / 60)
-)
+    # Simulation is over at this point. We acknowledge that all the simulation
+    # events were successful.
+    print("All simulation events were successful.")
+    # We print the final simulation statistics.
+
+    print("Performance statistics:")
+
+    tick_stopwatch = simulator.get_tick_stopwatch()
+    roi_begin_ticks = tick_stopwatch[0][1]
+    roi_end_ticks = tick_stopwatch[1][1]
+
+    print("roi simulated ticks: " + str(roi_end_ticks - roi_begin_ticks))
+
+    print(
+        "Ran a total of",
+        simulator.get_current_tick() / 1e12,
+        "simulated seconds",
+    )
+    print(
+        "Total wallclock time: %.2fs, %.2f min"
+        % (wallclock_time, wallclock_time / 60)
+    )
+
+
+if __name__ == "__m5_main__":
+    main()
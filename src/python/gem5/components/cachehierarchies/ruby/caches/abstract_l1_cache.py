@@ -25,23 +25,24 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from abc import abstractmethod
+import itertools
 from .....isas import ISA
 from ....processors.cpu_types import CPUTypes
 from ....processors.abstract_core import AbstractCore
 
 from m5.objects import L1Cache_Controller
 
-import math
-
 
 class AbstractL1Cache(L1Cache_Controller):
 
-    _version = 0
+    # This counter is shared by all AbstractL1Cache subclasses. This is safe
+    # as a build contains only one Ruby protocol, and so only one
+    # L1Cache_Controller type, whose versions must be unique.
+    _version = itertools.count()
 
     @classmethod
     def versionCount(cls):
-        cls._version += 1  # Use count for this particular type
-        return cls._version - 1
+        return next(cls._version)
 
     # TODO: I don't love that we have to pass in the cache line size.
     # However, we need some way to set the index bits
@@ -54,10 +55,10 @@ class AbstractL1Cache(L1Cache_Controller):
         self.connectQueues(network)
 
     def getBlockSizeBits(self):
-        bits = int(math.log(self._cache_line_size, 2))
-        if 2**bits != self._cache_line_size.value:
+        size = int(self._cache_line_size.value)
+        if size <= 0 or size & (size - 1):
             raise Exception("Cache line size not a power of 2!")
-        return bits
+        return size.bit_length() - 1
 
     @abstractmethod
     def connectQueues(self, network):
@@ -43,6 +43,10 @@ from m5.objects import (
 )
 from m5.params import PcCountPair
 
+# The ISAs which require evictions to be sent from cache to the CPU Core. See
+# `BaseCPUCore.requires_send_evicts`.
+_SEND_EVICTS_ISAS = frozenset({ISA.ARM, ISA.X86})
+
 
 class BaseCPUCore(AbstractCore):
     """
@@ -69,7 +73,7 @@ class BaseCPUCore(AbstractCore):
 
     @overrides(AbstractCore)
     def requires_send_evicts(self) -> bool:
-        if self.get_isa() in (ISA.ARM, ISA.X86):
+        if self.get_isa() in _SEND_EVICTS_ISAS:
             # * The x86 `mwait`` instruction is built on top of coherence,
             #   therefore evictions must be sent from cache to the CPU Core.
             #
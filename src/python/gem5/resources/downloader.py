@@ -30,19 +30,22 @@ import urllib.parse
 import hashlib
 import os
 import shutil
+import subprocess
 import gzip
+import io
 import hashlib
 import base64
 import time
 import random
 from pathlib import Path
 import tarfile
+from contextlib import contextmanager
 from tempfile import gettempdir
-from urllib.error import HTTPError
-from typing import List, Dict, Set, Optional
+from urllib.error import HTTPError, ContentTooShortError, URLError
+from typing import List, Dict, Set, Optional, BinaryIO, Iterator, Tuple
 
 from .md5_utils import md5_file, md5_dir
-from ..utils.progress_bar import tqdm, progress_hook
+from ..utils.progress_bar import tqdm
 
 from ..utils.filelock import FileLock
 
@@ -51,6 +54,20 @@ This Python module contains functions used to download, list, and obtain
 information about resources from resources.gem5.org.
 """
 
+# `requests` is optional. If it is installed, downloads over HTTP(S) share a
+# single session, so connections to the resources server are reused rather
+# than re-established for each file.
+try:
+    import requests
+    import urllib3
+
+    _requests_session = requests.Session()
+    # As with `urllib`, the files are requested without any transfer encoding
+    # so the bytes received are exactly those stored on the server.
+    _requests_session.headers["Accept-Encoding"] = "identity"
+except ImportError:
+    _requests_session = None
+
 
 def _resources_json_version_required() -> str:
     """
@@ -234,7 +251,104 @@ def _get_resources(
     return to_return
 
 
-def _download(url: str, download_to: str, max_attempts: int = 6) -> None:
+class _CountingReader:
+    """
+    Wraps a readable binary file object, counting the bytes read from it.
+    """
+
+    def __init__(self, fileobj: BinaryIO):
+        self._fileobj = fileobj
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self.bytes_read += len(data)
+        return data
+
+    # Without `tqdm`, `tqdm.wrapattr` returns this object unwrapped, so it is
+    # entered as a context manager in its place. Closing is left to the
+    # owner of the wrapped file object.
+    def __enter__(self) -> "_CountingReader":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+
+@contextmanager
+def _open_url(
+    url: str, context=None, use_session: bool = True
+) -> Iterator[Tuple[BinaryIO, Optional[int]]]:
+    """
+    Opens a URL for streaming.
+
+    HTTP(S) URLs are opened with the shared `requests` session, if `requests`
+    is installed and `use_session` is True. Otherwise `urllib` is used.
+
+    :param url: The URL to open.
+
+    :param context: The SSL context passed to `urllib`.
+
+    :param use_session: If False, the shared `requests` session is not used.
+    True by default.
+
+    :returns: The response body, as a readable binary file object, and its
+    length in bytes (None if unknown).
+
+    :raises HTTPError: An HTTPError is raised if the server responds with an
+    HTTP error status code.
+
+    :raises ContentTooShortError: A ContentTooShortError is raised if the
+    connection drops while the body is read with `requests`.
+
+    :raises URLError: A URLError is raised if `requests` fails to connect or
+    times out.
+    """
+
+    if (
+        use_session
+        and _requests_session is not None
+        and urllib.parse.urlparse(url).scheme in ("http", "https")
+    ):
+        # `requests` and `urllib3` raise their own exceptions. These are
+        # translated to their `urllib` equivalents so callers handle failures
+        # the same way whichever library fetched the URL.
+        try:
+            response = _requests_session.get(url, stream=True, timeout=60)
+        except requests.exceptions.RequestException as e:
+            raise URLError(e) from e
+        with response:
+            if response.status_code >= 400:
+                raise HTTPError(
+                    url,
+                    response.status_code,
+                    response.reason,
+                    response.headers,
+                    None,
+                )
+            length = response.headers.get("Content-Length")
+            # Once the body has been read in full, the connection is returned
+            # to the session's pool for the next download.
+            try:
+                yield response.raw, int(length) if length else None
+            except urllib3.exceptions.ProtocolError as e:
+                raise ContentTooShortError(
+                    f"Download of '{url}' was interrupted: {e}", None
+                ) from e
+            except urllib3.exceptions.HTTPError as e:
+                raise URLError(e) from e
+    else:
+        request = urllib.request.Request(url)
+        with urllib.request.urlopen(request, context=context) as response:
+            yield response, getattr(response, "length", None)
+
+
+def _download(
+    url: str,
+    download_to: str,
+    max_attempts: int = 6,
+    gzip_decompress: bool = False,
+) -> None:
     """
     Downloads a file.
 
@@ -248,11 +362,25 @@ def _download(url: str, download_to: str, max_attempts: int = 6) -> None:
     :param max_attempts: The max number of download attempts before stopping.
     The default is 6. This translates to roughly 1 minute of retrying before
     stopping.
+
+    :param gzip_decompress: If True, the file is gzip decompressed as it is
+    downloaded and the decompressed file is stored at `download_to`. The
+    compressed file is never written to disk. False by default.
+
+    :raises ContentTooShortError: A ContentTooShortError is raised if fewer
+    bytes are received than the server advertised.
     """
 
     # TODO: This whole setup will only work for single files we can get via
     # wget. We also need to support git clones going forward.
 
+    # The file is downloaded to a ".part" file and only moved to
+    # `download_to` once complete. A download which is killed, fails to
+    # decompress, or whose connection is dropped (caught by the length check
+    # below) therefore never leaves a truncated file at `download_to`, which
+    # could otherwise be mistaken for a previously downloaded resource.
+    download_part = f"{download_to}.part"
+
     attempt = 0
     while True:
         # The loop will be broken on a successful download, via a `return`, or
@@ -262,6 +390,7 @@ def _download(url: str, download_to: str, max_attempts: int = 6) -> None:
         try:
             # check to see if user requests a proxy connection
             use_proxy = os.getenv("GEM5_USE_PROXY")
+            ctx = None
             if use_proxy:
                 # If the "use_proxy" variable is specified we setup a socks5
                 # connection.
@@ -280,29 +409,35 @@ def _download(url: str, download_to: str, max_attempts: int = 6) -> None:
                 ctx.check_hostname = False
                 ctx.verify_mode = ssl.CERT_NONE
 
-                # get the file as a bytes blob
-                request = urllib.request.Request(url)
-                with urllib.request.urlopen(request, context=ctx) as fr:
-                    with tqdm.wrapattr(
-                        open(download_to, "wb"),
-                        "write",
-                        miniters=1,
-                        desc="Downloading {download_to}",
-                        total=getattr(fr, "length", None),
-                    ) as fw:
-                        for chunk in fr:
-                            fw.write(chunk)
-            else:
-                with tqdm(
+            # The SOCKS proxy above is only set up for `urllib`.
+            use_session = not use_proxy
+            with _open_url(url, ctx, use_session) as (response, length):
+                body = _CountingReader(response)
+                with tqdm.wrapattr(
+                    body,
+                    "read",
                     unit="B",
                     unit_scale=True,
                     unit_divisor=1024,
                     miniters=1,
                     desc=f"Downloading {download_to}",
-                ) as t:
-                    urllib.request.urlretrieve(
-                        url, download_to, reporthook=progress_hook(t)
-                    )
+                    total=length,
+                ) as fr:
+                    if gzip_decompress:
+                        _decompress_gz(src=fr, dst=download_part)
+                    else:
+                        with open(download_part, "wb") as fw:
+                            shutil.copyfileobj(fr, fw, length=1024 * 1024)
+            # `urllib` returns EOF, rather than raising, if the connection is
+            # closed before the whole body has been received. The length is
+            # therefore checked here so a truncated file is never installed.
+            if length is not None and body.bytes_read < length:
+                raise ContentTooShortError(
+                    f"Download of '{url}' was incomplete: retrieved "
+                    f"{body.bytes_read} of {length} bytes.",
+                    None,
+                )
+            os.replace(download_part, download_to)
             return
         except HTTPError as e:
             # If the error code retrieved is retryable, we retry using a
@@ -333,6 +468,42 @@ def _download(url: str, download_to: str, max_attempts: int = 6) -> None:
                 "installed. It can be installed with "
                 "`pip install PySocks`."
             )
+        finally:
+            if os.path.exists(download_part):
+                os.remove(download_part)
+
+
+def _decompress_gz(src: BinaryIO, dst: str) -> None:
+    """
+    Decompresses a stream of gzipped data to a file.
+
+    Where available, a native decompressor (`pigz`, then `gunzip`) is used as
+    these are considerably faster than Python's `gzip` module on large files
+    such as disk images. The data is piped to the decompressor as it is read
+    from `src`, so, when `src` is a download, decompression overlaps with the
+    transfer. If neither is found on the PATH, the decompression falls back to
+    the `gzip` module, with enlarged read and copy buffers.
+
+    :param src: A readable binary file object holding the gzipped data.
+
+    :param dst: The path to which the decompressed file is to be written.
+    """
+
+    for decompressor in ("pigz", "gunzip"):
+        if shutil.which(decompressor):
+            with open(dst, "wb") as o, subprocess.Popen(
+                [decompressor, "-d", "-c"], stdin=subprocess.PIPE, stdout=o
+            ) as p:
+                shutil.copyfileobj(src, p.stdin, length=1024 * 1024)
+            if p.returncode != 0:
+                raise subprocess.CalledProcessError(p.returncode, p.args)
+            return
+
+    with io.BufferedReader(
+        gzip.GzipFile(fileobj=src, mode="rb"), buffer_size=128 * 1024
+    ) as f:
+        with open(dst, "wb") as o:
+            shutil.copyfileobj(f, o, length=1024 * 1024)
 
 
 def list_resources() -> List[str]:
@@ -483,10 +654,6 @@ def get_resource(
         if run_tar_extract:
             download_dest += tar_extension
 
-        zip_extension = ".gz"
-        if run_unzip:
-            download_dest += zip_extension
-
         # TODO: Might be nice to have some kind of download status bar here.
         # TODO: There might be a case where this should be silenced.
         print(
@@ -499,21 +666,12 @@ def get_resource(
         # with the correct value.
         url = resource_json["url"].format(url_base=_get_url_base())
 
-        _download(url=url, download_to=download_dest)
+        # Gzipped resources are decompressed as they are downloaded.
+        _download(
+            url=url, download_to=download_dest, gzip_decompress=run_unzip
+        )
         print(f"Finished downloading resource '{resource_name}'.")
 
-        if run_unzip:
-            print(
-                f"Decompressing resource '{resource_name}' ('{download_dest}')..."
-            )
-            unzip_to = download_dest[: -len(zip_extension)]
-            with gzip.open(download_dest, "rb") as f:
-                with open(unzip_to, "wb") as o:
-                    shutil.copyfileobj(f, o)
-            os.remove(download_dest)
-            download_dest = unzip_to
-            print(f"Finished decompressing resource '{resource_name}'.")
-
         if run_tar_extract:
             print(
                 f"Unpacking the the resource '{resource_name}' "
@@ -585,7 +585,7 @@ def obtain_resource(
         # Download the resource if it does not already exist.
         get_resource(
             resource_name=resource_name,
-            to_path=os.path.join(resource_directory, resource_name),
+            to_path=to_path,
             download_md5_mismatch=download_md5_mismatch,
         )
 
@@ -43,6 +43,7 @@ import sys
 import socket
 import threading
 import gzip
+import io
 
 import urllib.error
 import urllib.request
@@ -295,6 +296,40 @@ class DownloadedProgram(UniqueFixture):
         self.name = "Downloaded:" + self.filename
         self.gzip_decompress = gzip_decompress
 
+    def _fetch(self, path, gzip_decompress=False):
+        """
+        Streams the file at self.url to path. If gzip_decompress is True, the
+        file is decompressed as it is downloaded, so the compressed file is
+        never written to disk. The file is written to a ".part" file first
+        and only moved to path once complete, so an interrupted download is
+        never mistaken for a downloaded file.
+        """
+        part_path = path + ".part"
+        try:
+            with urllib.request.urlopen(self.url) as response:
+                infile = response
+                if gzip_decompress:
+                    infile = io.BufferedReader(
+                        gzip.GzipFile(fileobj=response, mode="rb"),
+                        buffer_size=128 * 1024,
+                    )
+                with open(part_path, "wb") as outfile:
+                    shutil.copyfileobj(infile, outfile, length=1 << 20)
+                # http.client counts `length` down as the body is read. If the
+                # connection is closed early, EOF is returned rather than an
+                # error, leaving `length` non-zero. As urlretrieve did, this
+                # is treated as a failed download.
+                if getattr(response, "length", None):
+                    raise urllib.error.ContentTooShortError(
+                        "Download of %s was incomplete: %d bytes missing"
+                        % (self.url, response.length),
+                        None,
+                    )
+            os.replace(part_path, path)
+        finally:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+
     def _download(self):
         import errno
 
@@ -305,17 +340,7 @@ class DownloadedProgram(UniqueFixture):
             except OSError as e:
                 if e.errno != errno.EEXIST:
                     raise
-        if self.gzip_decompress:
-            gzipped_filename = self.filename + ".gz"
-            urllib.request.urlretrieve(self.url, gzipped_filename)
-
-            with open(self.filename, "wb") as outfile:
-                with gzip.open(gzipped_filename, "r") as infile:
-                    shutil.copyfileobj(infile, outfile)
-
-            os.remove(gzipped_filename)
-        else:
-            urllib.request.urlretrieve(self.url, self.filename)
+        self._fetch(self.filename, gzip_decompress=self.gzip_decompress)
 
     def _getremotetime(self):
         import datetime, time
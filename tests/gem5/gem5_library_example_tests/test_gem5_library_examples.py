@@ -37,6 +37,8 @@ if config.bin_path:
 else:
     resource_path = joinpath(absdirpath(__file__), "..", "resources")
 
+example_dir = joinpath(config.base_dir, "configs", "example", "gem5_library")
+
 hello_verifier = verifier.MatchRegex(re.compile(r"Hello world!"))
 save_checkpoint_verifier = verifier.MatchRegex(
     re.compile(r"Done taking a checkpoint")
@@ -46,9 +48,7 @@ gem5_verify_config(
     name="test-gem5-library-example-arm-hello",
     fixtures=(),
     verifiers=(hello_verifier,),
-    config=joinpath(
-        config.base_dir, "configs", "example", "gem5_library", "arm-hello.py"
-    ),
+    config=joinpath(example_dir, "arm-hello.py"),
     config_args=[],
     valid_isas=(constants.all_compiled_tag,),
     valid_hosts=constants.supported_hosts,
@@ -60,12 +60,7 @@ gem5_verify_config(
     fixtures=(),
     verifiers=(save_checkpoint_verifier,),
     config=joinpath(
-        config.base_dir,
-        "configs",
-        "example",
-        "gem5_library",
-        "checkpoints",
-        "riscv-hello-save-checkpoint.py",
+        example_dir, "checkpoints", "riscv-hello-save-checkpoint.py"
     ),
     config_args=[
         "--checkpoint-path",
@@ -81,12 +76,7 @@ gem5_verify_config(
     fixtures=(),
     verifiers=(hello_verifier,),
     config=joinpath(
-        config.base_dir,
-        "configs",
-        "example",
-        "gem5_library",
-        "checkpoints",
-        "riscv-hello-restore-checkpoint.py",
+        example_dir, "checkpoints", "riscv-hello-restore-checkpoint.py"
     ),
     config_args=[],
     valid_isas=(constants.all_compiled_tag,),
@@ -98,14 +88,7 @@ gem5_verify_config(
     name="test-simpoints-se-checkpoint",
     fixtures=(),
     verifiers=(),
-    config=joinpath(
-        config.base_dir,
-        "configs",
-        "example",
-        "gem5_library",
-        "checkpoints",
-        "simpoints-se-checkpoint.py",
-    ),
+    config=joinpath(example_dir, "checkpoints", "simpoints-se-checkpoint.py"),
     config_args=[
         "--checkpoint-path",
         joinpath(resource_path, "se_checkpoint_folder-save"),
@@ -119,95 +102,37 @@ gem5_verify_config(
     name="test-simpoints-se-restore",
     fixtures=(),
     verifiers=(),
-    config=joinpath(
-        config.base_dir,
-        "configs",
-        "example",
-        "gem5_library",
-        "checkpoints",
-        "simpoints-se-restore.py",
-    ),
+    config=joinpath(example_dir, "checkpoints", "simpoints-se-restore.py"),
     config_args=[],
     valid_isas=(constants.all_compiled_tag,),
     valid_hosts=constants.supported_hosts,
     length=constants.quick_tag,
 )
 
-if os.access("/dev/kvm", mode=os.R_OK | os.W_OK):
-    # The x86-ubuntu-run uses KVM cores, this test will therefore only be run
-    # on systems that support KVM.
-    gem5_verify_config(
-        name="test-gem5-library-example-x86-ubuntu-run-with-kvm",
-        fixtures=(),
-        verifiers=(),
-        config=joinpath(
-            config.base_dir,
-            "configs",
-            "example",
-            "gem5_library",
-            "x86-ubuntu-run-with-kvm.py",
-        ),
-        config_args=[],
-        valid_isas=(constants.all_compiled_tag,),
-        valid_hosts=(constants.host_x86_64_tag,),
-        length=constants.long_tag,
-        uses_kvm=True,
-    )
-
 gem5_verify_config(
     name="test-gem5-library-example-x86-ubuntu-run",
     fixtures=(),
     verifiers=(),
-    config=joinpath(
-        config.base_dir,
-        "configs",
-        "example",
-        "gem5_library",
-        "x86-ubuntu-run.py",
-    ),
+    config=joinpath(example_dir, "x86-ubuntu-run.py"),
     config_args=[],
     valid_isas=(constants.all_compiled_tag,),
     valid_hosts=constants.supported_hosts,
     length=constants.long_tag,
 )
 
-if os.access("/dev/kvm", mode=os.R_OK | os.W_OK):
-    # The x86-parsec-benchmarks uses KVM cores, this test will therefore only
-    # be run on systems that support KVM.
-    gem5_verify_config(
-        name="test-gem5-library-example-x86-parsec-benchmarks",
-        fixtures=(),
-        verifiers=(),
-        config=joinpath(
-            config.base_dir,
-            "configs",
-            "example",
-            "gem5_library",
-            "x86-parsec-benchmarks.py",
-        ),
-        config_args=["--benchmark", "blackscholes", "--size", "simsmall"],
-        valid_isas=(constants.all_compiled_tag,),
-        protocol="MESI_Two_Level",
-        valid_hosts=(constants.host_x86_64_tag,),
-        length=constants.long_tag,
-        uses_kvm=True,
-    )
-
-if os.access("/dev/kvm", mode=os.R_OK | os.W_OK):
-    # The x86-npb-benchmarks uses KVM cores, this test will therefore only be
-    # run on systems that support KVM.
-    gem5_verify_config(
-        name="test-gem5-library-example-x86-npb-benchmarks",
-        fixtures=(),
-        verifiers=(),
-        config=joinpath(
-            config.base_dir,
-            "configs",
-            "example",
-            "gem5_library",
-            "x86-npb-benchmarks.py",
-        ),
-        config_args=[
+# The following examples use KVM cores. These tests will therefore only be run
+# on systems that support KVM. Each entry is the example's name, the arguments
+# passed to it, and the Ruby protocol it requires (if any).
+kvm_examples = (
+    ("x86-ubuntu-run-with-kvm", [], None),
+    (
+        "x86-parsec-benchmarks",
+        ["--benchmark", "blackscholes", "--size", "simsmall"],
+        "MESI_Two_Level",
+    ),
+    (
+        "x86-npb-benchmarks",
+        [
             "--benchmark",
             "bt",
             "--size",
@@ -215,46 +140,35 @@ if os.access("/dev/kvm", mode=os.R_OK | os.W_OK):
             "--ticks",
             "5000000000",
         ],
-        valid_isas=(constants.all_compiled_tag,),
-        protocol="MESI_Two_Level",
-        valid_hosts=(constants.host_x86_64_tag,),
-        length=constants.long_tag,
-        uses_kvm=True,
-    )
+        "MESI_Two_Level",
+    ),
+    (
+        "x86-gapbs-benchmarks",
+        ["--benchmark", "bfs", "--synthetic", "1", "--size", "1"],
+        "MESI_Two_Level",
+    ),
+)
 
 if os.access("/dev/kvm", mode=os.R_OK | os.W_OK):
-    # The x86-gapbs-benchmarks uses KVM cores, this test will therefore only
-    # be run on systems that support KVM.
-    gem5_verify_config(
-        name="test-gem5-library-example-x86-gapbs-benchmarks",
-        fixtures=(),
-        verifiers=(),
-        config=joinpath(
-            config.base_dir,
-            "configs",
-            "example",
-            "gem5_library",
-            "x86-gapbs-benchmarks.py",
-        ),
-        config_args=["--benchmark", "bfs", "--synthetic", "1", "--size", "1"],
-        valid_isas=(constants.all_compiled_tag,),
-        protocol="MESI_Two_Level",
-        valid_hosts=(constants.host_x86_64_tag,),
-        length=constants.long_tag,
-        uses_kvm=True,
-    )
+    for example, config_args, protocol in kvm_examples:
+        gem5_verify_config(
+            name=f"test-gem5-library-example-{example}",
+            fixtures=(),
+            verifiers=(),
+            config=joinpath(example_dir, f"{example}.py"),
+            config_args=config_args,
+            valid_isas=(constants.all_compiled_tag,),
+            protocol=protocol,
+            valid_hosts=(constants.host_x86_64_tag,),
+            length=constants.long_tag,
+            uses_kvm=True,
+        )
 
 gem5_verify_config(
     name="test-gem5-library-example-riscv-ubuntu-run",
     fixtures=(),
     verifiers=(),
-    config=joinpath(
-        config.base_dir,
-        "configs",
-        "example",
-        "gem5_library",
-        "riscv-ubuntu-run.py",
-    ),
+    config=joinpath(example_dir, "riscv-ubuntu-run.py"),
     config_args=[],
     valid_isas=(constants.all_compiled_tag,),
     valid_hosts=constants.supported_hosts,
@@ -278,13 +192,7 @@ gem5_verify_config(
     name="test-gem5-library-example-arm-ubuntu-run-test",
     fixtures=(),
     verifiers=(),
-    config=joinpath(
-        config.base_dir,
-        "configs",
-        "example",
-        "gem5_library",
-        "arm-ubuntu-run.py",
-    ),
+    config=joinpath(example_dir, "arm-ubuntu-run.py"),
     config_args=[],
     valid_isas=(constants.all_compiled_tag,),
     valid_hosts=constants.supported_hosts,
@@ -295,13 +203,7 @@ gem5_verify_config(
     name="test-gem5-library-example-riscvmatched-hello",
     fixtures=(),
     verifiers=(),
-    config=joinpath(
-        config.base_dir,
-        "configs",
-        "example",
-        "gem5_library",
-        "riscvmatched-hello.py",
-    ),
+    config=joinpath(example_dir, "riscvmatched-hello.py"),
     config_args=[],
     valid_isas=(constants.all_compiled_tag,),
     valid_hosts=constants.supported_hosts,
@@ -312,13 +214,7 @@ gem5_verify_config(
     name="test-gem5-library-example-riscvmatched-fs",
     fixtures=(),
     verifiers=(),
-    config=joinpath(
-        config.base_dir,
-        "configs",
-        "example",
-        "gem5_library",
-        "riscvmatched-fs.py",
-    ),
+    config=joinpath(example_dir, "riscvmatched-fs.py"),
     config_args=["--to-init"],
     valid_isas=(constants.all_compiled_tag,),
     valid_hosts=constants.supported_hosts,
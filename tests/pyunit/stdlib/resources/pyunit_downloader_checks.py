@@ -25,15 +25,89 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import unittest
+from unittest import mock
 import tempfile
+import gzip
 import os
-from typing import Dict
+import subprocess
+import functools
+import threading
+from http.server import (
+    BaseHTTPRequestHandler,
+    SimpleHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
+from urllib.error import HTTPError, ContentTooShortError
+from pathlib import Path
+from typing import Dict, Iterator
+from contextlib import contextmanager
 
 from gem5.resources.downloader import (
     _get_resources_json_at_path,
     _get_resources_json,
     _resources_json_version_required,
+    _decompress_gz,
+    _download,
+    _requests_session,
 )
+from gem5.utils.progress_bar import FakeTQDM
+
+
+@contextmanager
+def _http_server(handler) -> Iterator[str]:
+    """
+    Runs a local HTTP server, handling requests with `handler`, for the
+    duration of the context. The server's base URL is yielded.
+    """
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+@contextmanager
+def _file_server(directory: str) -> Iterator[str]:
+    """
+    Runs a local HTTP server serving the files in `directory`. The server's
+    base URL is yielded.
+    """
+
+    class QuietHandler(SimpleHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+    with _http_server(
+        functools.partial(QuietHandler, directory=directory)
+    ) as url_base:
+        yield url_base
+
+
+@contextmanager
+def _truncating_server(body: bytes) -> Iterator[str]:
+    """
+    Runs a local HTTP server which advertises a Content-Length longer than
+    `body`, sends `body`, then closes the connection. The URL served is
+    yielded.
+    """
+
+    class TruncatingHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body) + 100000))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    with _http_server(TruncatingHandler) as url_base:
+        yield f"{url_base}/resource"
 
 
 class ResourceDownloaderTestSuite(unittest.TestCase):
@@ -139,3 +213,178 @@ class ResourceDownloaderTestSuite(unittest.TestCase):
 
         # Set back to the old path
         os.environ["GEM5_RESOURCE_JSON"] = self.file_path
+
+    def test_decompress_gz(self) -> None:
+        # Tests the gem5.resources.downloader._decompress_gz() function, both
+        # with whichever native decompressor is available on the host and with
+        # the Python `gzip` fallback.
+
+        contents = os.urandom(1024) * 512
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = os.path.join(tmpdir, "resource.gz")
+            with gzip.open(src, "wb") as f:
+                f.write(contents)
+
+            native_dst = os.path.join(tmpdir, "native")
+            with open(src, "rb") as f:
+                _decompress_gz(src=f, dst=native_dst)
+            with open(native_dst, "rb") as f:
+                self.assertEqual(contents, f.read())
+
+            fallback_dst = os.path.join(tmpdir, "fallback")
+            with mock.patch("shutil.which", return_value=None):
+                with open(src, "rb") as f:
+                    _decompress_gz(src=f, dst=fallback_dst)
+            with open(fallback_dst, "rb") as f:
+                self.assertEqual(contents, f.read())
+
+    def test_download_gzip_decompress(self) -> None:
+        # Tests the gem5.resources.downloader._download() function when the
+        # downloaded file is decompressed as it is retrieved.
+
+        contents = os.urandom(1024) * 512
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = os.path.join(tmpdir, "resource.gz")
+            with gzip.open(src, "wb") as f:
+                f.write(contents)
+
+            dst = os.path.join(tmpdir, "resource")
+            _download(
+                url=Path(src).as_uri(), download_to=dst, gzip_decompress=True
+            )
+            with open(dst, "rb") as f:
+                self.assertEqual(contents, f.read())
+            self.assertEqual(
+                ["resource", "resource.gz"], sorted(os.listdir(tmpdir))
+            )
+
+    def test_download_without_tqdm(self) -> None:
+        # Tests the gem5.resources.downloader._download() function when
+        # `tqdm` is not installed, in which case `FakeTQDM` is used.
+
+        contents = os.urandom(1024) * 512
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = os.path.join(tmpdir, "resource.gz")
+            with gzip.open(src, "wb") as f:
+                f.write(contents)
+
+            with mock.patch("gem5.resources.downloader.tqdm", FakeTQDM()):
+                plain_dst = os.path.join(tmpdir, "plain")
+                _download(url=Path(src).as_uri(), download_to=plain_dst)
+
+                gzip_dst = os.path.join(tmpdir, "resource")
+                _download(
+                    url=Path(src).as_uri(),
+                    download_to=gzip_dst,
+                    gzip_decompress=True,
+                )
+
+            with open(src, "rb") as f, open(plain_dst, "rb") as g:
+                self.assertEqual(f.read(), g.read())
+            with open(gzip_dst, "rb") as f:
+                self.assertEqual(contents, f.read())
+
+    def test_download_interrupted(self) -> None:
+        # Tests the gem5.resources.downloader._download() function leaves no
+        # file behind if the download cannot be completed.
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = os.path.join(tmpdir, "resource.gz")
+            with open(src, "wb") as f:
+                f.write(b"This is not gzipped data.")
+
+            dst = os.path.join(tmpdir, "resource")
+            # `gzip.BadGzipFile` is raised if neither `pigz` nor `gunzip` is
+            # installed.
+            with self.assertRaises(
+                (subprocess.CalledProcessError, gzip.BadGzipFile)
+            ):
+                _download(
+                    url=Path(src).as_uri(),
+                    download_to=dst,
+                    gzip_decompress=True,
+                )
+            self.assertEqual(["resource.gz"], os.listdir(tmpdir))
+
+        # A gzipped download whose connection is dropped part way through. The
+        # Python decompressor is used so the error does not depend on which
+        # decompression tools are installed.
+        compressed = gzip.compress(os.urandom(1024) * 512)
+        with _truncating_server(compressed[: len(compressed) // 2]) as url:
+            with tempfile.TemporaryDirectory() as tmpdir, mock.patch(
+                "shutil.which", return_value=None
+            ):
+                dst = os.path.join(tmpdir, "resource")
+
+                # `urllib` returns a short body, which `gzip` rejects.
+                with mock.patch(
+                    "gem5.resources.downloader._requests_session", None
+                ):
+                    with self.assertRaises(EOFError):
+                        _download(
+                            url=url, download_to=dst, gzip_decompress=True
+                        )
+                self.assertEqual([], os.listdir(tmpdir))
+
+                # `requests` reports the dropped connection itself.
+                if _requests_session is not None:
+                    with self.assertRaises(ContentTooShortError):
+                        _download(
+                            url=url, download_to=dst, gzip_decompress=True
+                        )
+                    self.assertEqual([], os.listdir(tmpdir))
+
+    def test_download_http(self) -> None:
+        # Tests the gem5.resources.downloader._download() function retrieving
+        # files over HTTP, including an HTTP error response.
+
+        contents = os.urandom(1024) * 512
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with gzip.open(os.path.join(tmpdir, "resource.gz"), "wb") as f:
+                f.write(contents)
+
+            with _file_server(tmpdir) as url_base:
+                dst = os.path.join(tmpdir, "resource")
+                _download(
+                    url=f"{url_base}/resource.gz",
+                    download_to=dst,
+                    gzip_decompress=True,
+                )
+                with open(dst, "rb") as f:
+                    self.assertEqual(contents, f.read())
+
+                with self.assertRaises(HTTPError) as context:
+                    _download(
+                        url=f"{url_base}/missing",
+                        download_to=os.path.join(tmpdir, "missing"),
+                    )
+                self.assertEqual(404, context.exception.code)
+                self.assertFalse(
+                    os.path.exists(os.path.join(tmpdir, "missing"))
+                )
+
+    def test_download_http_truncated(self) -> None:
+        # Tests the gem5.resources.downloader._download() function raises, and
+        # leaves no file behind, if the connection is closed before the
+        # advertised Content-Length has been received.
+
+        with _truncating_server(b"x" * 500) as url:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                dst = os.path.join(tmpdir, "resource")
+
+                # `urllib` is used when `requests` is not installed.
+                with mock.patch(
+                    "gem5.resources.downloader._requests_session", None
+                ):
+                    with self.assertRaises(ContentTooShortError):
+                        _download(url=url, download_to=dst)
+                self.assertEqual([], os.listdir(tmpdir))
+
+                # The `requests` path, if installed, raises the same error.
+                with self.assertRaises(ContentTooShortError):
+                    _download(url=url, download_to=dst)
+                self.assertEqual([], os.listdir(tmpdir))